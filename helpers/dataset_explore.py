@@ -1,14 +1,45 @@
 import os
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
+from .images import read_image
+
+
+def build_fragment_index(fragments_df):
+    """
+    Build a {unique_id: (model, kind, number)} lookup from fragments_df.
+    Pass it as fragments_index to the display_* helpers when showing many fragments,
+    and rebuild it after editing fragments_df.
+    """
+    # setdefault keeps the first row per ID, like iloc[0] on a filtered frame
+    idx = {}
+    entries = zip(fragments_df["model"], fragments_df["kind"], fragments_df["number"])
+    for unique_id, entry in zip(fragments_df["unique_id"], entries):
+        idx.setdefault(unique_id, entry)
+    return idx
+
+
+def _lookup_fragment(fragment_id, fragments_df, fragments_index=None):
+    """
+    Return (model, kind, number) for fragment_id, or None if it is not in fragments_df.
+    """
+    if fragments_index is not None:
+        return fragments_index.get(fragment_id)
+
+    row = fragments_df[fragments_df["unique_id"] == fragment_id]
+    if row.empty:
+        return None
+    first = row.iloc[0]
+    return first["model"], first["kind"], first["number"]
+
+
 def display_model_image(model_name, image_base_path="dataset/zoo"):
     """
     Display a UML image corresponding to the model_name.
     """
     img_path = os.path.join(image_base_path, f"{model_name}.png")
     if os.path.exists(img_path):
-        img = mpimg.imread(img_path)
+        import matplotlib.pyplot as plt
+
+        img = read_image(img_path)
         plt.figure(figsize=(10, 10))
         plt.imshow(img)
         plt.axis("off")
@@ -18,27 +49,44 @@ def display_model_image(model_name, image_base_path="dataset/zoo"):
         print(f"No image found for model '{model_name}' at {img_path}")
 
 
-def display_fragment_image(fragment_id, fragments_df, image_base_path="dataset/zoo"):
+def display_fragment_image(fragment_id, fragments_df, image_base_path="dataset/zoo", fragments_index=None, ax=None):
     """
     Display the UML fragment image based on a fragment ID and print the filename.
+    If ax is given, the image is drawn into that existing Axes instead of a new figure.
+    If fragments_index (from build_fragment_index) is given, it is used instead of scanning fragments_df.
     """
-    row = fragments_df[fragments_df["unique_id"] == fragment_id]
+    entry = _lookup_fragment(fragment_id, fragments_df, fragments_index)
 
-    if row.empty:
+    if entry is None:
         print(f"No fragment found with ID: {fragment_id}")
         return
 
-    model_name = row.iloc[0]["model"]
-    kind = row.iloc[0]["kind"]
-    number = row.iloc[0]["number"]
+    model_name, kind, number = entry
+    _display_fragment_image_row(model_name, kind, number, image_base_path, ax)
+
 
+def _display_fragment_image_row(model_name, kind, number, image_base_path="dataset/zoo", ax=None):
+    """
+    Display a fragment image from its model/kind/number, without looking it up in fragments_df.
+    """
     filename = f"{model_name}_{kind}{number}.png"
     img_path = os.path.join(image_base_path, filename)
 
     print(f"Fragment image path: {img_path}")
 
     if os.path.exists(img_path):
-        img = mpimg.imread(img_path)
+        import matplotlib.pyplot as plt
+
+        img = read_image(img_path)
+        if ax is not None:
+            # Reuse the caller's figure: redraw its axes instead of allocating a new one
+            ax.clear()
+            ax.imshow(img)
+            ax.axis("off")
+            ax.set_title(f"Fragment: {filename}")
+            _refresh_figure(ax.figure)
+            return
+
         plt.figure(figsize=(6, 6))
         plt.imshow(img)
         plt.axis("off")
@@ -48,22 +96,45 @@ def display_fragment_image(fragment_id, fragments_df, image_base_path="dataset/z
         print(f"No fragment image found at {img_path}")
 
 
-def display_fragment_and_model(fragment_id, fragments_df, image_base_path="dataset/zoo"):
+def _is_inline_backend():
+    import matplotlib.pyplot as plt
+
+    return "inline" in plt.get_backend()
+
+
+def _refresh_figure(fig):
+    """
+    Show the current state of a reused figure.
+    Inline (notebook) backends only render on display, GUI backends just need an idle redraw.
+    """
+    import matplotlib.pyplot as plt
+
+    if _is_inline_backend():
+        from IPython.display import display
+
+        display(fig)
+    else:
+        fig.canvas.draw_idle()
+        plt.pause(0.001)
+
+
+def display_fragment_and_model(fragment_id, fragments_df, image_base_path="dataset/zoo", fragments_index=None):
     """
     Display both the fragment image and its corresponding full model image.
+    If fragments_index (from build_fragment_index) is given, it is used instead of scanning fragments_df.
     """
-    row = fragments_df[fragments_df["unique_id"] == fragment_id]
+    entry = _lookup_fragment(fragment_id, fragments_df, fragments_index)
 
-    if row.empty:
+    if entry is None:
         print(f"No fragment found with ID: {fragment_id}")
         return
 
-    model_name = row.iloc[0]["model"]
+    model_name, kind, number = entry
 
     print(f"Displaying fragment {fragment_id} and full model '{model_name}'")
 
-    # Display fragment first (with file path)
-    display_fragment_image(fragment_id, fragments_df, image_base_path)
+    # Display fragment first (with file path), reusing the row found above
+    _display_fragment_image_row(model_name, kind, number, image_base_path)
 
     # Now display model image
     model_img_filename = os.path.join(image_base_path, f"{model_name}.png")
@@ -71,7 +142,7 @@ def display_fragment_and_model(fragment_id, fragments_df, image_base_path="datas
     display_model_image(model_name, image_base_path)
 
 
-def display_model_fragments(model_name, fragments_df, kind_filter="all"):
+def display_model_fragments(model_name, fragments_df, kind_filter="all", image_base_path="dataset/zoo"):
     """
     Display all fragment images for a given model.
 
@@ -79,6 +150,7 @@ def display_model_fragments(model_name, fragments_df, kind_filter="all"):
         model_name (str): Name of the UML model (e.g., "Make")
         fragments_df (pd.DataFrame): DataFrame with fragment metadata
         kind_filter (str): "all", "class", or "rel"
+        image_base_path (str): Folder containing the fragment images
     """
     filtered = fragments_df[fragments_df["model"] == model_name]
 
@@ -89,13 +161,22 @@ def display_model_fragments(model_name, fragments_df, kind_filter="all"):
         print(f"No fragments found for model '{model_name}' with kind='{kind_filter}'")
         return
 
-    for _, row in filtered.iterrows():
-        frag_id = row['unique_id']
-        number = row['number']
-        kind = row['kind']
+    import matplotlib.pyplot as plt
 
+    # Inline (notebook) backends render a figure only when it is displayed, so one figure
+    # can be redrawn and displayed for every fragment. Other backends (GUI windows, widget,
+    # nbAgg) keep one figure per fragment, since a redrawn window would end up showing
+    # only the last fragment.
+    fig, ax = plt.subplots(figsize=(6, 6)) if _is_inline_backend() else (None, None)
+
+    # The filtered rows already carry model/kind/number, so no per-fragment lookup is needed
+    for frag_id, number, kind in zip(filtered['unique_id'], filtered['number'], filtered['kind']):
         print("-" * 50)
         print(f"Fragment number: {number}")
         print(f"Fragment kind: {kind}")
         print(f"Fragment ID: {frag_id}")
-        display_fragment_image(frag_id, fragments_df)
+        _display_fragment_image_row(model_name, kind, number, image_base_path, ax)
+
+    if fig is not None:
+        # Already displayed per fragment; closing avoids a duplicate render at the end of the cell
+        plt.close(fig)
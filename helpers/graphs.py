@@ -1,5 +1,4 @@
 import networkx as nx
-import matplotlib.pyplot as plt
 
 def print_inheritance_hierarchy(inheritance_edges):
     """
@@ -44,6 +43,8 @@ def draw_inheritance_graph(inheritance_edges, model_name):
         print(f"[INFO] No inheritance edges to draw for {model_name}")
         return
 
+    import matplotlib.pyplot as plt
+
     G = nx.DiGraph()
     G.add_edges_from(inheritance_edges)
 
@@ -0,0 +1,20 @@
+import os
+import functools
+
+
+def read_image(img_path):
+    """
+    Decode an image file, reusing the decoded array while the file is unchanged.
+    The returned array is shared between callers; copy it before modifying.
+    """
+    return _read_image_cached(img_path, os.stat(img_path).st_mtime_ns)
+
+
+# Decoded PNGs are float32 RGBA (16 bytes per pixel, ~190 MB for a 4000x3000 model),
+# so only the last few images are kept.
+@functools.lru_cache(maxsize=8)
+def _read_image_cached(img_path, mtime_ns):
+    # mtime_ns is only part of the cache key, so edited images get decoded again
+    import matplotlib.image as mpimg
+
+    return mpimg.imread(img_path)
@@ -1,79 +1,208 @@
 import re
-import matplotlib.pyplot as plt
 import os
+import sys
+import mmap
+import logging
+import functools
+from contextlib import contextmanager
 from .graphs import draw_inheritance_graph, print_inheritance_hierarchy
-import matplotlib.image as mpimg
+from .images import read_image
+
+log = logging.getLogger(__name__)
+
+# One bracketed class token; group 1 is the text before any "|attributes" suffix (unstripped).
+# A line with exactly two tokens is a relation; the text between them is its connector.
+_CLASS_RE = re.compile(r"\[(?=[^\]])([^\]|]*)[^\]]*\]")
+
+# Connector markers in priority order (first hit wins)
+_OP_MAP = {
+    "^": "inheritance",
+    "++": "composition",
+    "*": "aggregation",
+    "->": "association",
+}
+
+# Whitespace allowed before "//" on a comment line: everything str.lstrip() strips except
+# \r and \n, which text mode treats as line breaks. Both parsers use this same set.
+_INDENT_WS = "\t\x0b\x0c\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005" \
+             "\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+
+# Bytes scanner for whole mmap'd files. Each match is a comment line (skipped), a class
+# token, or a line break; tokens are grouped per line so, as in the line parser, a line
+# with exactly two tokens is a relation. Line breaks follow text mode: \n, \r\n or \r.
+_YUML_SCAN_RE = re.compile(
+    rb"(?P<comment>(?:^|(?<=\r))(?:"
+    + b"|".join(re.escape(ch.encode("utf-8")) for ch in _INDENT_WS)
+    + rb")*//[^\r\n]*)"
+    rb"|(?P<token>\[(?=[^\]\r\n])([^\]|\r\n]*)[^\]\r\n]*\])"
+    rb"|(?P<eol>\r\n?|\n)",
+    re.MULTILINE
+)
+
 
 def parse_yuml_model(file_path, verbose=True):
+    """
+    Parse a .yuml file into (classes, inheritance, associations).
+
+    Quiet parses are memoized on (file_path, mtime), so re-running stats over the
+    same files skips parsing. Results are immutable (frozenset, tuple, tuple) since
+    they are shared between callers; copy them before mutating.
+
+    The parse trace goes to this module's logger at DEBUG level. verbose=True
+    prints it to stdout for this call only, whatever the logging config; enabling
+    DEBUG for "helpers.parsers" through logging config traces quiet calls as well.
+    """
+    if verbose:
+        with _debug_logging():
+            return _parse_yuml_file(file_path)
+    if log.isEnabledFor(logging.DEBUG):
+        # Bypass the cache so the trace is actually emitted
+        return _parse_yuml_file(file_path)
+    return _parse_yuml_cached(file_path, os.stat(file_path).st_mtime_ns)
+
+
+@contextmanager
+def _debug_logging():
+    """
+    Print this module's DEBUG records to stdout for the duration of the block, as the old
+    verbose prints did, regardless of any handlers configured elsewhere.
+    """
+    previous_level, previous_propagate = log.level, log.propagate
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.DEBUG)
+    log.propagate = False  # keep ancestor handlers from filtering or re-emitting the trace
+    try:
+        yield
+    finally:
+        log.removeHandler(handler)
+        log.setLevel(previous_level)
+        log.propagate = previous_propagate
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_yuml_cached(file_path, mtime_ns):
+    # mtime_ns is only part of the cache key, so edited files get re-parsed
+    return _parse_yuml_mmap(file_path)
+
+
+def _parse_yuml_mmap(file_path):
+    """
+    Untraced parse: one regex scan over the mmap'd file, decoding only the captured names.
+    Applies the same line rules as _parse_yuml_file, without building per-line strings.
+    """
+    classes = set()
+    inheritance = []
+    associations = []  # (src, dst, rel_type)
+
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return frozenset(), (), ()  # empty files cannot be mmap'd
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            line_tokens = []
+            for match in _YUML_SCAN_RE.finditer(mm):
+                kind = match.lastgroup
+                if kind == "token":
+                    line_tokens.append(match)
+                elif kind == "eol":
+                    _add_line_tokens(mm, line_tokens, classes, inheritance, associations)
+                    line_tokens = []
+                # comment lines start at a line break, so they never follow tokens
+            _add_line_tokens(mm, line_tokens, classes, inheritance, associations)
+
+    return frozenset(classes), tuple(inheritance), tuple(associations)
+
+
+def _add_line_tokens(mm, tokens, classes, inheritance, associations):
+    """
+    Record the class tokens found on one line of the mmap'd file, plus its relation if it has two.
+    """
+    if len(tokens) != 2:
+        classes.update(token.group(3).decode("utf-8").strip() for token in tokens)
+        return
+
+    first, second = tokens
+    src = first.group(3).decode("utf-8").strip()
+    dst = second.group(3).decode("utf-8").strip()
+    classes.add(src)
+    classes.add(dst)
+    connector = mm[first.end():second.start()].decode("utf-8")
+    _add_relation(src, dst, connector, inheritance, associations)
+
+
+def _add_relation(src, dst, connector, inheritance, associations):
+    """
+    Classify a relation by its connector text, append it to the matching edge list,
+    and return its type.
+    """
+    for op, rel_type in _OP_MAP.items():
+        if op in connector:
+            break
+    else:
+        rel_type = "unknown"
+
+    if rel_type == "inheritance":
+        inheritance.append((dst, src))  # child → parent
+    else:
+        associations.append((src, dst, rel_type))
+    return rel_type
+
+
+def _parse_yuml_file(file_path):
     classes = set()
     inheritance = []
     associations = []  # Now stores (src, dst, rel_type)
 
-    if verbose:
-        print(f"\nParsing file: {file_path}")
-        print("-" * 50)
+    # Checked once per file; per-line tracing costs a single bool test when off
+    debug = log.isEnabledFor(logging.DEBUG)
+    if debug:
+        log.debug("\nParsing file: %s", file_path)
+        log.debug("-" * 50)
 
     with open(file_path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f):
-            line = line.strip()
-            if not line or line.startswith('//'):
-                continue
-
-            if verbose:
-                print(f"\nLine {i}: {line}")
-
-            # Extract class names from brackets
-            class_names = re.findall(r'\[([^\]]+)\]', line)
-            normalized = [cls.split("|")[0].strip() for cls in class_names]
-            if verbose:
-                print(f" Raw class tokens: {class_names}")
-                print(f" Normalized class names: {normalized}")
+        # Text mode already normalizes \r\n and \r, so this splits exactly like iterating f
+        lines = f.read().split("\n")
+
+    for i, line in enumerate(lines):
+        # Blank lines, comments and lines without brackets carry no classes
+        if "[" not in line or line.lstrip(_INDENT_WS).startswith('//'):
+            continue
+
+        tokens = list(_CLASS_RE.finditer(line))
+        if len(tokens) != 2:
+            # Not a binary relation, but standalone class declarations still count
+            normalized = [token.group(1).strip() for token in tokens]
             classes.update(normalized)
-
-            if len(normalized) != 2:
-                if verbose:
-                    print(" Skipping line: Not a binary relation.")
-                continue
-
-            src, dst = normalized
-
-            # Check for inheritance
-            if "^" in line:
-                inheritance.append((dst, src))  # child → parent
-                if verbose:
-                    print(f" Detected INHERITANCE: {dst} → {src}")
-
-            # Check for composition
-            elif "++" in line:
-                associations.append((src, dst, "composition"))
-                if verbose:
-                    print(f" Detected COMPOSITION: {src} ++ {dst}")
-
-            # Check for aggregation/multiplicity
-            elif "*" in line:
-                associations.append((src, dst, "aggregation"))
-                if verbose:
-                    print(f" Detected AGGREGATION: {src} * {dst}")
-
-            # Directed association
-            elif "->" in line:
-                associations.append((src, dst, "association"))
-                if verbose:
-                    print(f" Detected ASSOCIATION: {src} -> {dst}")
-
+            if debug:
+                log.debug("\nLine %d: %s", i, line.strip())
+                log.debug(" Class names: %s", normalized)
+                log.debug(" Skipping line: Not a binary relation.")
+            continue
+
+        first, second = tokens
+        src = first.group(1).strip()
+        dst = second.group(1).strip()
+        connector = line[first.end():second.start()]
+        classes.add(src)
+        classes.add(dst)
+        rel_type = _add_relation(src, dst, connector, inheritance, associations)
+
+        if debug:
+            log.debug("\nLine %d: %s", i, line.strip())
+            if rel_type == "inheritance":
+                log.debug(" Detected INHERITANCE: %s → %s", dst, src)
             else:
-                associations.append((src, dst, "unknown"))
-                if verbose:
-                    print(f" Detected UNKNOWN relation: {src} ? {dst}")
+                log.debug(" Detected %s: %s %s %s", rel_type.upper(), src, connector, dst)
 
-    if verbose:
-        print("\nFinal Parsed Results")
-        print(f" Classes: {sorted(classes)}")
-        print(f" Inheritance Edges: {inheritance}")
-        print(f" Association Edges (typed): {associations}")
-        print("-" * 50)
+    if debug:
+        log.debug("\nFinal Parsed Results")
+        log.debug(" Classes: %s", sorted(classes))
+        log.debug(" Inheritance Edges: %s", inheritance)
+        log.debug(" Association Edges (typed): %s", associations)
+        log.debug("-" * 50)
 
-    return classes, inheritance, associations
+    return frozenset(classes), tuple(inheritance), tuple(associations)
 
 
 def inspect_model_yuml_visually(model_name, yuml_df, image_base_path="dataset/zoo"):
@@ -107,7 +236,9 @@ def inspect_model_yuml_visually(model_name, yuml_df, image_base_path="dataset/zo
     img_path = os.path.join(image_base_path, f"{model_name}.png")
     print(f"\nUML Diagram Image: {img_path}")
     if os.path.exists(img_path):
-        img = mpimg.imread(img_path)
+        import matplotlib.pyplot as plt
+
+        img = read_image(img_path)
         plt.figure(figsize=(10, 10))
         plt.imshow(img)
         plt.axis("off")
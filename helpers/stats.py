@@ -1,8 +1,47 @@
 import os
 import pandas as pd
-import networkx as nx
 from .parsers import parse_yuml_model
-from collections import Counter
+from collections import Counter, defaultdict
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+
+_WHITE, _GRAY, _BLACK = 0, 1, 2
+
+
+def _longest_path(edges):
+    """
+    Length (in edges) of the longest path in the inheritance graph given as (child, parent) edges.
+    Returns 0 if there are no edges or the graph has a cycle.
+    """
+    children = defaultdict(list)  # parent -> children
+    for child, parent in edges:
+        children[parent].append(child)
+
+    color = defaultdict(int)  # node -> _WHITE / _GRAY / _BLACK
+    depth = {}                # node -> longest path length starting at node
+
+    for root in list(children):
+        if color[root] != _WHITE:
+            continue
+        color[root] = _GRAY
+        stack = [(root, iter(children[root]))]
+        while stack:
+            node, it = stack[-1]
+            for child in it:
+                if color[child] == _GRAY:
+                    return 0  # back edge -> cycle
+                if color[child] == _WHITE:
+                    color[child] = _GRAY
+                    stack.append((child, iter(children.get(child, ()))))
+                    break
+            else:
+                # All children done: node's depth is one more than its deepest child
+                stack.pop()
+                color[node] = _BLACK
+                depth[node] = max((depth[c] + 1 for c in children.get(node, ())), default=0)
+
+    return max(depth.values(), default=0)
+
 
 def compute_model_stats(model_name, yuml_df):
     """
@@ -32,23 +71,24 @@ def compute_model_stats(model_name, yuml_df):
         raise ValueError(f"No .yuml file found for model '{model_name}'")
 
     file_path = row.iloc[0]["file_path"]
+    return _stats_worker(model_name, file_path)
 
+
+def _stats_worker(model_name, file_path):
+    """
+    Compute the compute_model_stats dict for one model straight from its .yuml path.
+    Kept at module level so ProcessPoolExecutor can pickle it.
+    """
     # --- Parse model content from yuml ---
-    # Returns: set of class names, list of (child, parent), and list of (src, dst, rel_type)
+    # Returns: frozenset of class names, tuple of (child, parent), and tuple of (src, dst, rel_type)
     classes, inheritance, associations = parse_yuml_model(file_path, verbose=False)
 
-    # --- Build inheritance graph and compute max depth (if valid DAG) ---
-    G = nx.DiGraph()
-    G.add_edges_from(inheritance)
-    if nx.is_directed_acyclic_graph(G) and len(G) > 0:
-        tree_depth = nx.dag_longest_path_length(G)
-    else:
-        tree_depth = 0
+    # --- Compute max inheritance depth (0 if empty or cyclic) ---
+    tree_depth = _longest_path(inheritance)
 
     # --- Count each association type separately (flat) ---
     # e.g., {"composition": 2, "aggregation": 1}
-    assoc_types = [rel_type for _, _, rel_type in associations]
-    assoc_type_counts = Counter(assoc_types)
+    assoc_type_counts = Counter(map(itemgetter(2), associations))
 
     # --- Flatten all relationship types into one dictionary ---
     # Includes inheritance as one of the competing types
@@ -76,6 +116,26 @@ def compute_model_stats(model_name, yuml_df):
     }
 
 
+def compute_all_model_stats(yuml_df, n_workers=None):
+    """
+    Compute compute_model_stats for every model in yuml_df, parsing files in parallel.
+
+    Parameters:
+        yuml_df (pd.DataFrame): DataFrame that maps model names to .yuml file paths
+        n_workers (int): Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        pd.DataFrame: One row of statistics per model (first .yuml file per model)
+    """
+    models = yuml_df.drop_duplicates(subset="model")
+
+    # chunksize amortizes the IPC round-trip over many small files
+    with ProcessPoolExecutor(max_workers=n_workers) as ex:
+        results = list(ex.map(_stats_worker, models["model"], models["file_path"], chunksize=16))
+
+    return pd.DataFrame(results)
+
+
 def compute_dataset_summary(stats_df):
     """
     Compute and return aggregate statistics and insights for the UML dataset.
@@ -98,15 +158,15 @@ def compute_dataset_summary(stats_df):
     std_depth = stats_df["tree_depth"].std()
 
     # Build combined association type counts across all models
-    label_counts = Counter()
-    for assoc_map in stats_df["association_types"]:
-        label_counts.update(assoc_map)
+    # (one column per association type, summed in a single pass; missing types count as 0)
+    assoc_matrix = pd.DataFrame.from_records(stats_df["association_types"].tolist())
+    label_counts = assoc_matrix.sum().astype(int)
 
     # Add inheritance as its own top-level label
     label_counts["inheritance"] = total_inheritance
 
     # Most frequent label type overall
-    most_frequent_label = label_counts.most_common(1)[0][0] if label_counts else None
+    most_frequent_label = label_counts.idxmax() if not label_counts.empty else None
 
     # Models with deepest trees
     max_depth_models = stats_df[stats_df["tree_depth"] == max_depth]["model"].tolist()
@@ -136,7 +196,7 @@ def compute_dataset_summary(stats_df):
         "std_classes_per_model": round(std_classes, 2),
 
         "most_frequent_label_overall": most_frequent_label,
-        "label_frequency_distribution": dict(label_counts),
+        "label_frequency_distribution": label_counts.to_dict(),
 
         "top_dense_models (blocks per class)": most_dense_models.to_dict(orient="records")
     }
@@ -2,6 +2,15 @@ import re
 import os
 import pandas as pd
 
+# <ModelName>[_<Kind><Number>].<Extension>; kind/number are None for full-model files
+_ZOO_FILENAME_RE = re.compile(r"^(.+?)(?:_(class|rel)(\d+))?\.(\w+)$", re.IGNORECASE)
+
+# Categorical dtypes for "kind" columns: compact codes and fast equality filters.
+# Parsed zoo filenames can also be full models; fragments.csv only lists class/rel.
+KIND_DTYPE = pd.CategoricalDtype(categories=["class", "rel", "full"])
+FRAGMENT_KIND_DTYPE = pd.CategoricalDtype(categories=["class", "rel"])
+
+
 def parse_zoo_filename(file_name):
     """
     Parse a zoo filename into kind, number, and file type.
@@ -11,19 +20,14 @@ def parse_zoo_filename(file_name):
     """
     file_name = file_name.strip()
 
-    # First check for fragment-style files: Model_kindNumber.ext
-    #<ModelName>_<Kind><Number>.<Extension>
-    match = re.match(r"^(.+?)_(class|rel)(\d+)\.(\w+)$", file_name, re.IGNORECASE)
+    # Fragment-style (Model_kindNumber.ext) and full-model (Model.ext) files in one match
+    match = _ZOO_FILENAME_RE.match(file_name)
     if match:
         model, kind, number, ext = match.groups()
+        if kind is None:
+            return "full", None, ext.lower()
         return kind.lower(), int(number), ext.lower()
 
-    # Then check for full-model files: Model.ext
-    match_full = re.match(r"^(.+?)\.(\w+)$", file_name, re.IGNORECASE)
-    if match_full:
-        model, ext = match_full.groups()
-        return "full", None, ext.lower()
-
     return None, None, None
 
 
@@ -31,50 +35,42 @@ def index_zoo_files(zoo_path="dataset/zoo"):
     """
     Return a DataFrame with all files in zoo/ and basic filename metadata.
     """
-    rows = []
-    for fname in os.listdir(zoo_path):
-        fpath = os.path.join(zoo_path, fname)
-        rows.append({
-            "file_name": fname,
-            "file_path": fpath
-        })
-    return pd.DataFrame(rows)
+    file_names, file_paths = [], []
+    with os.scandir(zoo_path) as entries:
+        for entry in entries:
+            file_names.append(entry.name)
+            file_paths.append(entry.path)
+    return pd.DataFrame({
+        "file_name": file_names,
+        "file_path": file_paths
+    })
 
 
 def match_models_to_zoo_files(models_df, zoo_files_df):
     """
-    Match zoo files to known model names (prefix match).
+    Match zoo files to known model names (model prefix of the file name).
     Returns:
         matched_df: files matched to a model
         unmatched_files_df: zoo files not matched to any model
         unmatched_models_df: models not matched to any file
     """
-    matched_rows = []
-    matched_file_names = set()
-    matched_models = set()
+    model_names = set(models_df['name'])
 
-    model_names = models_df['name'].unique()
+    # Model prefix of each file: strip the optional _classN/_relN suffix and the extension
+    file_models = zoo_files_df['file_name'].str.extract(_ZOO_FILENAME_RE)[0]
+    file_matched = file_models.isin(model_names)
 
-    for model_name in model_names:
-        matches = zoo_files_df[zoo_files_df['file_name'].str.startswith(model_name)]
-        if not matches.empty:
-            matched_models.add(model_name)
-        for _, row in matches.iterrows():
-            matched_rows.append({
-                "model": model_name,
-                "file_name": row["file_name"],
-                "file_path": row["file_path"]
-            })
-            matched_file_names.add(row["file_name"])
-
-    matched_df = pd.DataFrame(matched_rows)
+    # Files matched to a model, in zoo index order
+    matched_df = (
+        zoo_files_df.assign(model=file_models)
+        .loc[file_matched, ['model', 'file_name', 'file_path']]
+        .reset_index(drop=True)
+    )
 
     # Files not matched to any model
-    unmatched_files_df = zoo_files_df[~zoo_files_df['file_name'].isin(matched_file_names)].copy()
+    unmatched_files_df = zoo_files_df[~file_matched].copy()
 
     # Models that didn't match any file
-    unmatched_models_df = models_df[~models_df['name'].isin(matched_models)].copy()
+    unmatched_models_df = models_df[~models_df['name'].isin(set(file_models[file_matched]))].copy()
 
     return matched_df, unmatched_files_df, unmatched_models_df
-
-